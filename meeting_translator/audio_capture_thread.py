@@ -11,6 +11,7 @@
 
 import threading
 import queue
+import time
 try:
     # 优先使用 PyAudioWPatch (支持 WASAPI Loopback)
     import pyaudiowpatch as pyaudio
@@ -35,7 +36,8 @@ class AudioCaptureThread:
         channels: int = 1,
         chunk_size: int = 1600,  # 100ms @ 16kHz
         target_sample_rate: Optional[int] = None,
-        target_channels: Optional[int] = None
+        target_channels: Optional[int] = None,
+        batch_duration: float = 0.2  # 200ms
     ):
         """
         初始化音频捕获线程
@@ -48,6 +50,7 @@ class AudioCaptureThread:
             chunk_size: 每次读取的帧数
             target_sample_rate: 目标采样率（用于重采样），默认与 sample_rate 相同
             target_channels: 目标声道数（用于混音），默认与 channels 相同
+            batch_duration: 合并发送的时长（秒），攒够这么多音频才回调一次，0 表示不合并
         """
         self.device_index = device_index
         self.on_audio_chunk = on_audio_chunk
@@ -72,6 +75,11 @@ class AudioCaptureThread:
         if self.need_resample or self.need_remix:
             Out.status(f"音频转换: {self.sample_rate}Hz {self.channels}ch -> {self.target_sample_rate}Hz {self.target_channels}ch")
 
+        # 合并发送：回调缓冲区很小（frames_per_buffer=0 时通常只有 10ms 左右），
+        # 逐块回调会让每块都走一次跨线程调度 + WebSocket 帧，这里攒够 batch_duration 再发
+        self.batch_duration = batch_duration
+        self._batch_bytes = int(self.target_sample_rate * self.target_channels * 2 * batch_duration)  # 16-bit
+
         self.is_running = False
         self.pyaudio_instance = None
         self.stream = None
@@ -108,8 +116,15 @@ class AudioCaptureThread:
     def _process_loop(self):
         """
         音频处理循环（在独立线程中运行）
-        从队列取出音频数据，进行转换，然后调用回调
+        从队列取出音频数据，进行转换，合并到 batch_duration 后调用回调
         """
+        # 预分配固定大小的合并缓冲区，稳态下不再为合并重新分配内存；
+        # 只有交给回调时复制一次（数据要跨线程交给事件循环，不能直接复用缓冲区）
+        capacity = self._batch_bytes
+        buf = memoryview(bytearray(capacity))
+        filled = 0
+        deadline = 0.0  # 当前批次最晚发送时间（限制合并带来的延迟）
+
         while self.is_running:
             try:
                 # 从队列获取音频数据（带超时）
@@ -122,16 +137,51 @@ class AudioCaptureThread:
                 if self.need_resample or self.need_remix:
                     audio_data = self._convert_audio(audio_data)
 
-                # 调用外部回调
-                self.on_audio_chunk(audio_data)
+                size = len(audio_data)
+
+                # 放不下：先把已积攒的数据发出去
+                if filled and filled + size > capacity:
+                    chunk = bytes(buf[:filled])
+                    filled = 0
+                    self.on_audio_chunk(chunk)
+
+                # 单块就超过一批（或未启用合并）：直接回调
+                if size >= capacity:
+                    self.on_audio_chunk(audio_data)
+                    continue
+
+                if not filled:
+                    deadline = time.monotonic() + self.batch_duration
+                buf[filled:filled + size] = audio_data
+                filled += size
+
+                # 攒够一批或到达截止时间时调用外部回调
+                if filled >= capacity or time.monotonic() >= deadline:
+                    chunk = bytes(buf[:filled])
+                    filled = 0
+                    self.on_audio_chunk(chunk)
 
             except queue.Empty:
-                # 超时，继续
+                # 超时（设备欠载）：已到截止时间则先把积攒的数据发出去
+                if filled and time.monotonic() >= deadline:
+                    chunk = bytes(buf[:filled])
+                    filled = 0
+                    try:
+                        self.on_audio_chunk(chunk)
+                    except Exception as e:
+                        Out.error(f"音频处理出错: {e}")
                 continue
             except Exception as e:
                 Out.error(f"音频处理出错: {e}")
                 continue
 
+        # 停止时把未攒满的最后一批发出去，避免丢掉一句话的结尾
+        if filled:
+            try:
+                self.on_audio_chunk(bytes(buf[:filled]))
+            except Exception as e:
+                Out.error(f"音频处理出错: {e}")
+
         Out.debug("音频处理循环已退出")
 
     def start(self):
@@ -172,7 +172,7 @@ class MeetingTranslatorApp(QWidget):
         manager = Out
 
         # 清空临时 handlers（移除 __init__ 中添加的临时 ConsoleHandler）
-        manager.handlers.clear()
+        manager.clear_handlers()
 
         # 1. 添加控制台处理器（只显示翻译结果和错误，隐藏状态信息）
         console_handler = ConsoleHandler(
@@ -9,6 +9,7 @@ from typing import Optional, Dict, Any, List
 from dataclasses import dataclass, field
 import logging
 import sys
+import threading
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
@@ -105,7 +106,8 @@ class BaseHandler:
             enabled_types: 启用的消息类型列表（None=全部启用）
         """
         self.formatter = formatter or BaseFormatter()
-        self.enabled_types = set(enabled_types) if enabled_types else None
+        # 构造后不再修改，使用 frozenset 供 should_handle 做成员判断
+        self.enabled_types = frozenset(enabled_types) if enabled_types else None
 
     def should_handle(self, message_type: MessageType) -> bool:
         """
@@ -160,7 +162,11 @@ class OutputManager:
         if OutputManager._instance is not None:
             raise RuntimeError("Use get_instance() to get OutputManager")
 
-        self.handlers: List[BaseHandler] = []
+        # 处理器列表采用写时复制（copy-on-write）的 tuple：
+        # emit 可在任意线程（音频回调、websocket 协程、UI）无锁遍历快照，
+        # 只有 add/remove/clear 这类低频操作才需要加锁
+        self._handlers: tuple = ()
+        self._handlers_lock = threading.Lock()
         self.enabled = True  # 全局开关
 
         # 添加临时的控制台处理器（显示所有消息）
@@ -181,6 +187,11 @@ class OutputManager:
             cls._instance = cls()
         return cls._instance
 
+    @property
+    def handlers(self) -> tuple:
+        """当前处理器快照（只读）"""
+        return self._handlers
+
     def add_handler(self, handler: BaseHandler):
         """
         添加输出处理器
@@ -188,9 +199,11 @@ class OutputManager:
         Args:
             handler: 输出处理器
         """
-        if handler not in self.handlers:
-            self.handlers.append(handler)
-            logger.debug(f"添加处理器: {handler.__class__.__name__}")
+        with self._handlers_lock:
+            if handler in self._handlers:
+                return
+            self._handlers = self._handlers + (handler,)
+        logger.debug(f"添加处理器: {handler.__class__.__name__}")
 
     def remove_handler(self, handler: BaseHandler):
         """
@@ -199,9 +212,16 @@ class OutputManager:
         Args:
             handler: 输出处理器
         """
-        if handler in self.handlers:
-            self.handlers.remove(handler)
-            logger.debug(f"移除处理器: {handler.__class__.__name__}")
+        with self._handlers_lock:
+            if handler not in self._handlers:
+                return
+            self._handlers = tuple(h for h in self._handlers if h is not handler)
+        logger.debug(f"移除处理器: {handler.__class__.__name__}")
+
+    def clear_handlers(self):
+        """移除所有输出处理器"""
+        with self._handlers_lock:
+            self._handlers = ()
 
     def emit(self, message: TranslationMessage):
         """
@@ -213,7 +233,8 @@ class OutputManager:
         if not self.enabled:
             return
 
-        for handler in self.handlers:
+        # 读取一次快照，遍历期间其他线程增删处理器不会影响本次分发
+        for handler in self._handlers:
             try:
                 handler.handle(message)
             except Exception as e:
@@ -4,6 +4,8 @@
 """
 
 import os
+import shutil
+from datetime import datetime
 from pathlib import Path
 from i18n import get_i18n
 
@@ -96,12 +98,12 @@ def migrate_legacy_files():
                 dst_file = dst_dir / file.name
                 # 只有目标文件不存在时才迁移（避免覆盖）
                 if not dst_file.exists():
-                    import shutil
                     try:
-                        shutil.copy2(file, dst_file)
+                        # copyfile 只复制内容（Linux 上内部走 sendfile 零拷贝），
+                        # 不额外复制权限/时间戳等元数据
+                        shutil.copyfile(file, dst_file)
                         count += 1
                     except Exception as e:
-                        from i18n import get_i18n
                         i18n = get_i18n()
                         print(i18n.t("paths.migration_file_failed", file=str(file), error=str(e)))
 
@@ -115,7 +117,7 @@ def migrate_legacy_files():
     if sum(stats.values()) > 0:
         try:
             MIGRATION_MARKER.write_text(
-                f"Migration completed at {__import__('datetime').datetime.now()}\n"
+                f"Migration completed at {datetime.now()}\n"
                 f"Legacy files: {stats}\n"
             )
         except Exception:
@@ -132,6 +134,10 @@ def get_initialization_message():
     Returns:
         str: 初始化信息或空字符串
     """
+    # 已迁移过：标记文件存在意味着数据目录也已存在，无需再逐个探测旧目录
+    if MIGRATION_MARKER.exists():
+        return ""
+
     i18n = get_i18n()
     messages = []
 
@@ -5,10 +5,11 @@
 
 import os
 import time
-import base64
 import asyncio
+import itertools
 import json
 import websockets
+from types import MappingProxyType
 from typing import Dict, Optional
 try:
     # 优先使用 PyAudioWPatch (支持 WASAPI Loopback)
@@ -16,6 +17,24 @@ try:
 except ImportError:
     import pyaudio
 
+try:
+    # 可选：SIMD 加速的 base64（AVX2/NEON），默认不做解码校验
+    # b64encode_as_string 直接返回 str，省去中间 bytes 和 .decode() 的 ASCII 校验
+    from pybase64 import b64encode_as_string, b64decode
+except ImportError:
+    from base64 import b64encode
+    # a2b_base64 直接走 C 实现，省去 base64.b64decode 的参数校验包装
+    from binascii import a2b_base64 as b64decode
+
+    def b64encode_as_string(data: bytes) -> str:
+        return b64encode(data).decode("ascii")
+
+try:
+    # 可选：C 实现的 JSON 解析（orjson.JSONDecodeError 是 json.JSONDecodeError 的子类）
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
 import queue
 import threading
 
@@ -25,6 +44,10 @@ from translation_client_base import BaseTranslationClient, TranslationProvider
 from output_manager import Out
 
 
+# 事件字段缺失时使用的只读空字典（避免每次 .get(key, {}) 都新建一个 dict）
+_EMPTY = MappingProxyType({})
+
+
 def build_translation_instructions(glossary: Dict[str, str]) -> str:
     """
     构建翻译指令（极简版本）
@@ -39,7 +62,7 @@ def build_translation_instructions(glossary: Dict[str, str]) -> str:
         return ""
 
     # 使用紧凑的单行格式，避免多行列表被误解为需要输出的内容
-    terms = "/n".join([f"【{zh}:{en}】" for zh, en in glossary.items()])
+    terms = " ".join(f"【{zh}:{en}】" for zh, en in glossary.items())
 
     instructions = f"""常用词表: {terms}. """
     return instructions
@@ -73,6 +96,11 @@ class QwenClient(BaseTranslationClient):
         "nofish": "Nofish (男声)",
     }
 
+    # input_audio_buffer.append 事件的 JSON 信封（预先拆成固定片段，发送时只拼接 event_id 和音频）
+    _APPEND_PREFIX = '{"event_id":"event_'
+    _APPEND_MID = '","type":"input_audio_buffer.append","audio":"'
+    _APPEND_SUFFIX = '"}'
+
     # 支持的语言列表
     # 来源：https://help.aliyun.com/zh/model-studio/qwen3-livetranslate-flash-realtime
     # Key: 显示名称, Value: 语种代码
@@ -133,6 +161,12 @@ class QwenClient(BaseTranslationClient):
         self._input_format = pyaudio.paInt16
         self._input_channels = 1
 
+        # 翻译指令只依赖词汇表，构造时生成一次（重连会创建新的客户端，届时重新生成）
+        self._instructions = build_translation_instructions(self.glossary)
+
+        # 单调递增的事件序号（以毫秒时间戳为起点，所有上行事件共用，避免每个事件都调用 time.time()）
+        self._event_seq = itertools.count(int(time.time() * 1000))
+
     @property
     def input_rate(self) -> int:
         """输入采样率（麦克风）"""
@@ -184,7 +218,17 @@ class QwenClient(BaseTranslationClient):
         try:
             self.ws = await websockets.connect(
                 self.api_url,
-                extra_headers=headers
+                extra_headers=headers,
+                # 音频是 base64 PCM，几乎不可压缩，permessage-deflate 只会白耗 CPU
+                compression=None,
+                # 音频增量可能突发到达：放宽单帧上限（4MB）和接收队列（256 帧），避免背压卡住接收
+                # 代价是消费变慢时最多多缓存 max_queue 帧的内存，而音频处理本身很快
+                max_size=2 ** 22,
+                max_queue=256,
+                ping_interval=20,
+                ping_timeout=20,
+                # 关闭握手最多等 1 秒，服务端无响应时不拖慢停止/重连（stop() 只给 close() 2 秒）
+                close_timeout=1.0
             )
             self.is_connected = True
             self.output_status(f"已连接到阿里云 Qwen LiveTranslate 服务")
@@ -198,14 +242,14 @@ class QwenClient(BaseTranslationClient):
         """配置翻译会话"""
         # 基础配置（S2T 模式）
         config = {
-            "event_id": f"event_{int(time.time() * 1000)}",
+            "event_id": f"event_{next(self._event_seq)}",
             "type": "session.update",
             "session": {
                 "modalities": ["text"],  # S2T 模式：只有文本
                 "input_audio_format": "pcm16",
                 "translation": {
                     "language": self.target_language,
-                    "instructions": build_translation_instructions(self.glossary),
+                    "instructions": self._instructions,
                 },
                 "turn_detection": {
                     "type": "server_vad",
@@ -235,106 +279,122 @@ class QwenClient(BaseTranslationClient):
             return
 
         try:
-            event = {
-                "event_id": f"event_{int(time.time() * 1000)}",
-                "type": "input_audio_buffer.append",
-                "audio": base64.b64encode(audio_data).decode()
-            }
-            await self.ws.send(json.dumps(event))
+            # base64 字符集无需 JSON 转义，直接拼接信封，省去 json.dumps 对整段音频的再次扫描
+            # 协议要求文本帧，因此仍以 str 发送
+            await self.ws.send("".join((
+                self._APPEND_PREFIX,
+                str(next(self._event_seq)),
+                self._APPEND_MID,
+                b64encode_as_string(audio_data),
+                self._APPEND_SUFFIX,
+            )))
         except Exception as e:
             self.output_error(f"发送音频块失败: {e}")
 
+    def _build_event_handlers(self):
+        """
+        构建事件类型 → 处理方法的分发表
+
+        S2S/S2T 专属事件只在对应模式下注册，未注册（含无需输出）的事件直接忽略。
+        response.done 与 input_audio_transcription.completed 不输出，因此不注册。
+        """
+        handlers = {
+            "response.audio_transcript.done": self._on_audio_transcript_done,
+            "conversation.item.input_audio_transcription.failed": self._on_transcription_failed,
+            "error": self._on_error,
+        }
+        if self.audio_enabled:
+            handlers["response.audio.delta"] = self._on_audio_delta
+        else:
+            handlers["response.text.text"] = self._on_text_delta
+            handlers["response.text.done"] = self._on_text_done
+        return handlers
+
     async def handle_server_messages(self, on_text_received=None):
         """处理服务器消息"""
         # S2T 模式：维护当前句子的全量文本
         self._current_sentence = ""
         self._current_predicted = ""
 
+        handlers = self._build_event_handlers()
+
         try:
             async for message in self.ws:
-                event = json.loads(message)
-                event_type = event.get("type")
-
-                if event_type == "response.audio.delta" and self.audio_enabled:
-                    # 音频增量数据（仅 S2S）
-                    audio_b64 = event.get("delta", "")
-                    if audio_b64:
-                        audio_data = base64.b64decode(audio_b64)
-                        self._queue_audio(audio_data)  # 放入外部队列
-
-                elif event_type == "response.done":
-                    # 响应完成（不输出）
-                    pass
-
-                elif event_type == "conversation.item.input_audio_transcription.completed":
-                    # 源语言转录完成（不输出，避免冗余）
-                    pass
-
-                elif event_type == "response.audio_transcript.done":
-                    # 目标语言翻译完成（S2S 模式的翻译文本）
-                    transcript = event.get("transcript", "")
-                    if transcript:
-                        self.output_translation(transcript, extra_metadata={"provider": "aliyun", "mode": "S2S"})
-                        
-
-                elif event_type == "response.text.text" and not self.audio_enabled:
-                    # S2T 模式：非最终更新
-                    text = event.get("text", "")
-                    predicted = event.get("stash", "")  # Qwen 的预测文本
-
-                    if text:
-                        # 更新全量文本（Qwen 是 replace 模式）
-                        self._current_sentence = text
-                        self._current_predicted = predicted if predicted else ""
-
-                        # 发送临时字幕（包含预测文本）
-                        self.output_subtitle(
-                            target_text=self._current_sentence, 
-                            is_final=False,
-                            predicted_text=self._current_predicted,
-                            extra_metadata={"provider": "aliyun", "mode": "S2T"})
-                            
-
-                elif event_type == "response.text.done" and not self.audio_enabled:
-                    # S2T 模式：翻译完成
-                    response_data = event.get("response", {})
-                    text = response_data.get("text", "")
-
-                    # 如果顶层也有 text 字段，优先使用
-                    if not text:
-                        text = event.get("text", "")
-
-                    if text:
-                        # 更新最终全量文本
-                        self._current_sentence = text
-                        self._current_predicted = ""
-
-                        # 发送最终字幕
-                        self.output_subtitle(
-                            target_text=self._current_sentence,
-                            is_final=True,
-                            extra_metadata={"provider": "aliyun", "mode": "S2T"})
-                        
-                        # 重置
-                        self._current_sentence = ""
-                    else:
-                        self.output_warning("[S2T Done] 事件中没有找到翻译文本")
-
-                elif event_type == "conversation.item.input_audio_transcription.failed":
-                    # 源语言转录失败
-                    error = event.get("error", {})
-                    self.output_warning(f"源语言转录失败: {error.get('message', 'Unknown error')}")
-
-                elif event_type == "error":
-                    # 错误消息
-                    error_message = event.get("error", {}).get("message", "Unknown error")
-                    self.output_error(f"服务器错误: {error_message}")
+                event = json_loads(message)
+                handler = handlers.get(event.get("type"))
+                if handler:
+                    handler(event)
 
         except websockets.exceptions.ConnectionClosed:
             self.output_warning("WebSocket 连接已关闭")
         except Exception as e:
             self.output_error(f"处理服务器消息时出错: {e}", exc_info=True)
 
+    def _on_audio_delta(self, event: dict):
+        """音频增量数据（仅 S2S）"""
+        audio_b64 = event.get("delta", "")
+        if audio_b64:
+            audio_data = b64decode(audio_b64)
+            self._queue_audio(audio_data)  # 放入外部队列
+
+    def _on_audio_transcript_done(self, event: dict):
+        """目标语言翻译完成（S2S 模式的翻译文本）"""
+        transcript = event.get("transcript", "")
+        if transcript:
+            self.output_translation(transcript, extra_metadata={"provider": "aliyun", "mode": "S2S"})
+
+    def _on_text_delta(self, event: dict):
+        """S2T 模式：非最终更新"""
+        text = event.get("text", "")
+        predicted = event.get("stash", "")  # Qwen 的预测文本
+
+        if text:
+            # 更新全量文本（Qwen 是 replace 模式）
+            self._current_sentence = text
+            self._current_predicted = predicted if predicted else ""
+
+            # 发送临时字幕（包含预测文本）
+            self.output_subtitle(
+                target_text=self._current_sentence,
+                is_final=False,
+                predicted_text=self._current_predicted,
+                extra_metadata={"provider": "aliyun", "mode": "S2T"})
+
+    def _on_text_done(self, event: dict):
+        """S2T 模式：翻译完成"""
+        response_data = event.get("response", _EMPTY)
+        text = response_data.get("text", "")
+
+        # 如果顶层也有 text 字段，优先使用
+        if not text:
+            text = event.get("text", "")
+
+        if text:
+            # 更新最终全量文本
+            self._current_sentence = text
+            self._current_predicted = ""
+
+            # 发送最终字幕
+            self.output_subtitle(
+                target_text=self._current_sentence,
+                is_final=True,
+                extra_metadata={"provider": "aliyun", "mode": "S2T"})
+
+            # 重置
+            self._current_sentence = ""
+        else:
+            self.output_warning("[S2T Done] 事件中没有找到翻译文本")
+
+    def _on_transcription_failed(self, event: dict):
+        """源语言转录失败"""
+        error = event.get("error", _EMPTY)
+        self.output_warning(f"源语言转录失败: {error.get('message', 'Unknown error')}")
+
+    def _on_error(self, event: dict):
+        """服务器错误消息"""
+        error_message = event.get("error", _EMPTY).get("message", "Unknown error")
+        self.output_error(f"服务器错误: {error_message}")
+
     async def close(self):
         """关闭连接并清理资源"""
         self.is_connected = False
@@ -408,11 +468,11 @@ class QwenClient(BaseTranslationClient):
                 response_complete = False
 
                 # 直接处理消息循环（30秒总超时）
-                start_time = time.time()
+                start_time = time.monotonic()
                 try:
                     while True:
                         # 检查总超时
-                        if time.time() - start_time > 30:
+                        if time.monotonic() - start_time > 30:
                             break
 
                         # 接收消息（10秒单次超时，但不提前退出）
@@ -422,14 +482,14 @@ class QwenClient(BaseTranslationClient):
                             # 单次超时继续等待，直到总超时或收到完成事件
                             continue
                         try:
-                            event = json.loads(message)
+                            event = json_loads(message)
                             event_type = event.get("type", "")
 
                             # 收集音频输出
                             if event_type == "response.audio.delta" and self.audio_enabled:
                                 audio_b64 = event.get("delta", "")
                                 if audio_b64:
-                                    audio_data = base64.b64decode(audio_b64)
+                                    audio_data = b64decode(audio_b64)
                                     audio_chunks.append(audio_data)
 
                             elif event_type == "response.done":
@@ -5,18 +5,94 @@
 """
 
 from PyQt5.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QSizeGrip, QTextEdit, QPushButton
-from PyQt5.QtCore import Qt, QPoint, QSize
-from PyQt5.QtGui import QFont, QColor, QPalette, QTextCursor
+from PyQt5.QtCore import Qt, QPoint, QSize, QTimer
+from PyQt5.QtGui import QFont, QColor, QPalette, QTextCursor, QTextBlockFormat, QTextCharFormat
+from collections import deque
 from datetime import datetime
 import os
+import shutil
+import tempfile
 
 from output_manager import Out
 from i18n import get_i18n
 
 
+# 窗口标志：置顶 + 无边框 + 工具窗口
+# （原来重复 OR 了一次 WindowStaysOnTopHint，按位或重复无效果，已去掉）
+_WINDOW_FLAGS = (
+    Qt.WindowStaysOnTopHint |  # 始终在最上层
+    Qt.FramelessWindowHint |   # 无边框
+    Qt.Tool                    # 工具窗口（不在任务栏显示）
+)
+
+# 样式表（模块级常量，所有窗口实例共用）
+_TEXT_EDIT_QSS = """
+QTextEdit {
+    color: #FFFFFF;
+    background-color: rgba(20, 20, 25, 220);
+    border: 2px solid rgba(100, 150, 255, 100);
+    border-radius: 10px;
+    padding: 20px;
+}
+QScrollBar:vertical {
+    background-color: rgba(255, 255, 255, 30);
+    width: 12px;
+    border-radius: 6px;
+}
+QScrollBar::handle:vertical {
+    background-color: rgba(100, 150, 255, 150);
+    border-radius: 6px;
+    min-height: 30px;
+}
+QScrollBar::handle:vertical:hover {
+    background-color: rgba(120, 170, 255, 200);
+}
+"""
+
+_BUTTON_QSS = """
+QPushButton {
+    background-color: rgba(100, 150, 255, 150);
+    border: 2px solid rgba(255, 255, 255, 180);
+    border-radius: 5px;
+    color: white;
+    font-weight: bold;
+    font-size: 14px;
+}
+QPushButton:hover {
+    background-color: rgba(120, 170, 255, 200);
+}
+QPushButton:pressed {
+    background-color: rgba(80, 130, 235, 180);
+}
+"""
+
+_GRIP_QSS = """
+QSizeGrip {
+    background-color: rgba(100, 150, 255, 150);
+    border: 2px solid rgba(255, 255, 255, 180);
+    border-radius: 5px;
+}
+QSizeGrip:hover {
+    background-color: rgba(120, 170, 255, 200);
+}
+"""
+
+
 class SubtitleWindow(QWidget):
     """字幕悬浮窗"""
 
+    # 内存中保留的字幕条数，更早的字幕转存到临时文件（保存会议记录时一并写出）
+    HISTORY_MAX_ITEMS = 2000
+
+    # 字幕行模板：双语格式中 source + 箭头作为 source 的一部分，单语言格式只有 timestamp
+    # target 的显示格式始终保持一致（不包含箭头）
+    _LINE_TPL = "[%s] %s 　　　　→%s"
+    _LINE_TPL_NO_SRC = "[%s]%s"
+    _PARTIAL_TPL = "[%s] %s 　　　　→ %s "
+    _PARTIAL_TPL_NO_SRC = "[%s] %s "
+    _RECORD_TPL = "[%s] %s 　　　　→ %s\n\n"
+    _RECORD_TPL_NO_SRC = "[%s] %s\n\n"
+
     def __init__(self):
         super().__init__()
 
@@ -24,12 +100,7 @@ class SubtitleWindow(QWidget):
         self.i18n = get_i18n()
 
         # 窗口属性 - 强制置顶
-        self.setWindowFlags(
-            Qt.WindowStaysOnTopHint |  # 始终在最上层
-            Qt.FramelessWindowHint |   # 无边框
-            Qt.Tool |                  # 工具窗口（不在任务栏显示）
-            Qt.WindowStaysOnTopHint    # 再次确保置顶（某些系统需要）
-        )
+        self.setWindowFlags(_WINDOW_FLAGS)
 
         # 设置透明背景
         self.setAttribute(Qt.WA_TranslucentBackground)
@@ -39,14 +110,35 @@ class SubtitleWindow(QWidget):
 
         # 会议记录
         self.meeting_start_time = datetime.now()  # 记录会议开始时间
-        self.subtitle_history = []  # 字幕历史记录
+        self.subtitle_history = deque(maxlen=self.HISTORY_MAX_ITEMS)  # 字幕历史记录（最近的部分）
+        self._spill_file = None  # 超出上限被挤出的旧字幕（已格式化的文本，按需创建）
         self.current_partial_text = ""  # 当前正在显示的增量文本（未finalize）
         self.current_source_text = ""  # 当前正在显示的源文本（英文）
+        self.current_predicted_text = ""  # 当前正在显示的预测文本
+        self._partial_ts_str = ""  # 当前增量文本首次出现的时间（渲染时不再每次取时间）
+
+        # 增量渲染：文档 = 已确定的历史（只追加）+ 末尾的增量行（每次替换）
+        # _tail_length 是末尾增量行占用的字符数，历史部分的结束位置从文档末尾倒推
+        # （文档超出块数上限时会从开头淘汰旧块，绝对位置会整体前移）
+        self._tail_length = 0
+
+        # 增量文本合并刷新：流式增量每秒可达几十次，只在定时器到期时渲染最新的一次
+        self._partial_timer = QTimer(self)
+        self._partial_timer.setSingleShot(True)
+        self._partial_timer.setInterval(33)  # 约 30 次/秒
+        self._partial_timer.timeout.connect(self._flush_partial)
 
         # 字体大小设置
         self.font_size = 20  # 默认字体大小
         self.min_font_size = 12  # 最小字体大小
         self.max_font_size = 48  # 最大字体大小
+        self._font_cache = {}  # 字号 -> QFont，避免反复解析字体
+
+        # 连续点击 A+/A- 时只在停下后重新排版一次
+        self._font_timer = QTimer(self)
+        self._font_timer.setSingleShot(True)
+        self._font_timer.setInterval(80)
+        self._font_timer.timeout.connect(self._update_font)
 
         # 初始化 UI
         self.init_ui()
@@ -67,35 +159,29 @@ class SubtitleWindow(QWidget):
 
         # 字幕文本框（支持滚动和历史记录）
         self.subtitle_text = QTextEdit()
-        self.subtitle_text.setFont(QFont("Microsoft YaHei", self.font_size, QFont.Bold))  # 使用变量控制的字体大小
+        self.subtitle_text.setFont(self._font_for(self.font_size))  # 使用变量控制的字体大小
         self.subtitle_text.setReadOnly(True)  # 只读
+        self.subtitle_text.setUndoRedoEnabled(False)  # 只读文本不需要撤销栈
+        # 文档最多保留与内存历史相同数量的字幕块（+1 为增量行），超出时自动淘汰最早的块
+        self.subtitle_text.document().setMaximumBlockCount(self.HISTORY_MAX_ITEMS + 1)
+        self.subtitle_text.setAcceptRichText(False)  # 不接受富文本粘贴
         # 允许文本选择和复制 (类似浏览器行为，但不可编辑)
         self.subtitle_text.setTextInteractionFlags(Qt.TextBrowserInteraction)
-        self.subtitle_text.setStyleSheet("""
-            QTextEdit {
-                color: #FFFFFF;
-                background-color: rgba(20, 20, 25, 220);
-                border: 2px solid rgba(100, 150, 255, 100);
-                border-radius: 10px;
-                padding: 20px;
-            }
-            QScrollBar:vertical {
-                background-color: rgba(255, 255, 255, 30);
-                width: 12px;
-                border-radius: 6px;
-            }
-            QScrollBar::handle:vertical {
-                background-color: rgba(100, 150, 255, 150);
-                border-radius: 6px;
-                min-height: 30px;
-            }
-            QScrollBar::handle:vertical:hover {
-                background-color: rgba(120, 170, 255, 200);
-            }
-        """)
+        self.subtitle_text.setStyleSheet(_TEXT_EDIT_QSS)
         self.subtitle_text.setPlaceholderText(self.i18n.t("ui.subtitle.waiting"))
         layout.addWidget(self.subtitle_text)
 
+        # 每条字幕一个文本块，块间距 12px
+        self._block_format = QTextBlockFormat()
+        self._block_format.setBottomMargin(12)
+
+        # 预先构建的字符格式（直接 insertText，不再拼接/解析 HTML）
+        self._fmt_text = QTextCharFormat()  # 正文：沿用文本框的字体和颜色
+        self._fmt_pred = QTextCharFormat()  # 预测文本：灰色
+        self._fmt_pred.setForeground(QColor(160, 160, 160, 217))
+        self._fmt_ell = QTextCharFormat()  # 省略号：蓝色
+        self._fmt_ell.setForeground(QColor(100, 150, 255, 204))
+
         # 控制栏（右下角）：字体大小按钮 + 缩放手柄
         control_bar = QHBoxLayout()
         control_bar.setSpacing(8)
@@ -107,22 +193,7 @@ class SubtitleWindow(QWidget):
         self.font_decrease_btn = QPushButton("A-")
         self.font_decrease_btn.setFixedSize(40, 30)
         self.font_decrease_btn.setToolTip(self.i18n.t("ui.tooltips.font_decrease"))
-        self.font_decrease_btn.setStyleSheet("""
-            QPushButton {
-                background-color: rgba(100, 150, 255, 150);
-                border: 2px solid rgba(255, 255, 255, 180);
-                border-radius: 5px;
-                color: white;
-                font-weight: bold;
-                font-size: 14px;
-            }
-            QPushButton:hover {
-                background-color: rgba(120, 170, 255, 200);
-            }
-            QPushButton:pressed {
-                background-color: rgba(80, 130, 235, 180);
-            }
-        """)
+        self.font_decrease_btn.setStyleSheet(_BUTTON_QSS)
         self.font_decrease_btn.clicked.connect(self.decrease_font_size)
         control_bar.addWidget(self.font_decrease_btn)
 
@@ -130,38 +201,14 @@ class SubtitleWindow(QWidget):
         self.font_increase_btn = QPushButton("A+")
         self.font_increase_btn.setFixedSize(40, 30)
         self.font_increase_btn.setToolTip(self.i18n.t("ui.tooltips.font_increase"))
-        self.font_increase_btn.setStyleSheet("""
-            QPushButton {
-                background-color: rgba(100, 150, 255, 150);
-                border: 2px solid rgba(255, 255, 255, 180);
-                border-radius: 5px;
-                color: white;
-                font-weight: bold;
-                font-size: 14px;
-            }
-            QPushButton:hover {
-                background-color: rgba(120, 170, 255, 200);
-            }
-            QPushButton:pressed {
-                background-color: rgba(80, 130, 235, 180);
-            }
-        """)
+        self.font_increase_btn.setStyleSheet(_BUTTON_QSS)
         self.font_increase_btn.clicked.connect(self.increase_font_size)
         control_bar.addWidget(self.font_increase_btn)
 
         # 添加缩放手柄（更大、更明显）
         self.size_grip = QSizeGrip(self)
         self.size_grip.setFixedSize(30, 30)  # 增大手柄 20x20 -> 30x30
-        self.size_grip.setStyleSheet("""
-            QSizeGrip {
-                background-color: rgba(100, 150, 255, 150);
-                border: 2px solid rgba(255, 255, 255, 180);
-                border-radius: 5px;
-            }
-            QSizeGrip:hover {
-                background-color: rgba(120, 170, 255, 200);
-            }
-        """)
+        self.size_grip.setStyleSheet(_GRIP_QSS)
         control_bar.addWidget(self.size_grip)
 
         # 控制栏布局（右下角对齐）
@@ -185,114 +232,135 @@ class SubtitleWindow(QWidget):
         if is_final:
             # 最终文本：添加到历史记录（存储结构化数据）
             timestamp = datetime.now()
-            self.subtitle_history.append({
+            item = {
                 'timestamp': timestamp,
                 'source': source or "",
                 'target': target
-            })
+            }
+            if len(self.subtitle_history) == self.HISTORY_MAX_ITEMS:
+                # 最旧的一条即将被挤出，先转存到临时文件
+                self._spill_history_item(self.subtitle_history[0])
+            self.subtitle_history.append(item)
 
             # 清空当前增量文本
             self.current_partial_text = ""
             self.current_predicted_text = ""
             self.current_source_text = ""
+            self._partial_ts_str = ""
+            self._partial_timer.stop()  # 待刷新的增量已被最终文本取代
 
-            # 重新渲染所有内容
-            self._render_subtitles()
+            # 只追加这一条（不重建历史）
+            self._render_subtitles(item)
 
             # Out.debug(f"字幕已添加: {source} → {target}")
         else:
+            # 与当前显示的增量内容完全相同时不重复渲染
+            if (target == self.current_partial_text
+                    and (source or "") == self.current_source_text
+                    and (predicted_text or "") == self.current_predicted_text):
+                return
+
             # 增量文本：临时显示在最后一行
+            if not self.current_partial_text:
+                # 新的一段开始，固定这一段的时间戳
+                self._partial_ts_str = datetime.now().strftime("%H:%M:%S")
             self.current_partial_text = target
             self.current_predicted_text = predicted_text or ""  # 保存预测文本
             self.current_source_text = source or ""  # 保存当前源文本
-            self._render_subtitles()
+            if not self._partial_timer.isActive():
+                self._partial_timer.start()
 
             # Out.debug(f"增量字幕: {target}")
 
-    def _render_subtitles(self):
-        """渲染所有字幕（历史记录 + 当前增量）"""
-        # HTML 格式的文本 - 使用更好的排版样式
-        html_parts = []
+    def _spill_history_item(self, item: dict):
+        """把一条旧字幕写入临时文件"""
+        if self._spill_file is None:
+            self._spill_file = tempfile.TemporaryFile('w+', encoding='utf-8')
+        self._spill_file.write(self._format_record_line(item))
+
+    def _format_record_line(self, item: dict) -> str:
+        """生成会议记录文件中的一条字幕"""
+        timestamp_str = item['timestamp'].strftime("%H:%M:%S")
+        source = item['source']
+        if source:
+            return self._RECORD_TPL % (timestamp_str, source, item['target'])
+        return self._RECORD_TPL_NO_SRC % (timestamp_str, item['target'])
+
+    def _flush_partial(self):
+        """定时器到期：渲染最新的增量文本"""
+        self._render_subtitles()
+
+    def _begin_block(self, cursor: QTextCursor):
+        """在 cursor 处开始新的一行（文档为空时复用第一个文本块）"""
+        if cursor.position() > 0:
+            cursor.insertBlock(self._block_format)
+        else:
+            cursor.setBlockFormat(self._block_format)
+
+    def _remove_partial(self, cursor: QTextCursor):
+        """删除历史部分之后的增量行，cursor 停在历史末尾"""
+        end = self.subtitle_text.document().characterCount() - 1
+        cursor.setPosition(end - self._tail_length)
+        cursor.movePosition(QTextCursor.End, QTextCursor.KeepAnchor)
+        cursor.removeSelectedText()
+        self._tail_length = 0
+
+    def _append_history_item(self, cursor: QTextCursor, item: dict):
+        """在 cursor（历史部分末尾）处追加一条最终字幕"""
+        timestamp_str = item['timestamp'].strftime("%H:%M:%S")
+        source = item['source']
+        if source:
+            line = self._LINE_TPL % (timestamp_str, source, item['target'])
+        else:
+            line = self._LINE_TPL_NO_SRC % (timestamp_str, item['target'])
 
-        # 添加历史记录（白色，已确定）
-        for item in self.subtitle_history:
-            timestamp_str = item['timestamp'].strftime("%H:%M:%S")
-            source = item['source']
-            target = item['target']
+        self._begin_block(cursor)
+        cursor.insertText(line, self._fmt_text)
 
-            # target 的显示格式始终保持一致（不包含箭头）
-            target_html = f'{self._escape_html(target)}'
+    def _render_subtitles(self, new_item: dict = None):
+        """
+        渲染字幕（历史部分只追加，不再重建）
 
-            # 构建头部行：timestamp + (source + 箭头) 或仅 timestamp
-            if source:
-                # 双语格式：source + 箭头作为 source 的一部分
-                header_line = f"[{timestamp_str}] {self._escape_html(source)} 　　　　→"
-            else:
-                # 单语言格式：只有 timestamp
-                header_line = f"[{timestamp_str}]"
+        Args:
+            new_item: 新的最终字幕（可选），追加到历史部分末尾
+        """
+        # 用户向上翻看历史时不要把视图拉回底部
+        scroll_bar = self.subtitle_text.verticalScrollBar()
+        at_bottom = scroll_bar.value() >= scroll_bar.maximum() - 2
+
+        cursor = QTextCursor(self.subtitle_text.document())
+        cursor.beginEditBlock()  # 删除 + 插入合并为一次修改，只重新布局一次
+        self._remove_partial(cursor)
 
-            # 复用相同的结构
-            html_parts.append(f'''
-                <div style="margin-bottom: 12px;">
-                    <span>{header_line}</span><span>{target_html}</span>
-                    
-                </div>
-            ''')
+        if new_item is not None:
+            self._append_history_item(cursor, new_item)
 
         # 如果有增量文本，添加到末尾
         if self.current_partial_text:
-            timestamp_str = datetime.now().strftime("%H:%M:%S")
-
-            # target 的显示格式始终保持一致（不包含箭头）
-            target_html = f'{self._escape_html(self.current_partial_text)}'
-            # 构建头部行：timestamp + (source + 箭头) 或仅 timestamp
+            tail_start = cursor.position()
             if self.current_source_text:
-                # 双语格式：source + 箭头作为 source 的一部分
-                header_line = f"[{timestamp_str}] {self._escape_html(self.current_source_text)} 　　　　→"
+                line = self._PARTIAL_TPL % (self._partial_ts_str, self.current_source_text, self.current_partial_text)
             else:
-                # 单语言格式：只有 timestamp
-                header_line = f"[{timestamp_str}]"
+                line = self._PARTIAL_TPL_NO_SRC % (self._partial_ts_str, self.current_partial_text)
 
+            self._begin_block(cursor)
+            cursor.insertText(line, self._fmt_text)
             if self.current_predicted_text:
-                predicted_str=f'<span style="color: rgba(160, 160, 160, 0.85);">{self._escape_html(self.current_predicted_text)}</span> '
-            else: 
-                predicted_str=""
-            # 复用相同的结构
-            html_parts.append(f'''
-                <div style="margin-bottom: 12px;">
-                    <span>{header_line}</span>
-                    <span>{target_html}</span>
-                    {predicted_str}
-                    <span style="color: rgba(100, 150, 255, 0.8);">...</span>
-                </div>
-            ''')
-
-        # 组合所有 HTML
-        html_content = ''.join(html_parts)
-
-        # 更新文本框（使用 HTML）
-        self.subtitle_text.setHtml(html_content)
-
-        # 自动滚动到底部
-        cursor = self.subtitle_text.textCursor()
-        cursor.movePosition(QTextCursor.End)
-        self.subtitle_text.setTextCursor(cursor)
-        self.subtitle_text.ensureCursorVisible()
-
-    def _escape_html(self, text: str) -> str:
-        """转义 HTML 特殊字符"""
-        return (text
-                .replace('&', '&amp;')
-                .replace('<', '&lt;')
-                .replace('>', '&gt;')
-                .replace('"', '&quot;')
-                .replace("'", '&#39;'))
+                cursor.insertText(self.current_predicted_text, self._fmt_pred)
+                cursor.insertText(" ", self._fmt_text)
+            cursor.insertText("...", self._fmt_ell)
+            self._tail_length = cursor.position() - tail_start
+        cursor.endEditBlock()
+
+        # 原本就在底部时才自动滚动（直接设置滚动条，不移动文本光标）
+        if at_bottom:
+            scroll_bar.setValue(scroll_bar.maximum())
 
     def increase_font_size(self):
         """增大字体大小"""
         if self.font_size < self.max_font_size:
             self.font_size += 2
-            self._update_font()
+            self._font_timer.start()
             Out.status(self.i18n.t("status.font_size_changed", size=self.font_size))
         else:
             Out.status(self.i18n.t("status.font_size_max"))
@@ -301,23 +369,39 @@ class SubtitleWindow(QWidget):
         """减小字体大小"""
         if self.font_size > self.min_font_size:
             self.font_size -= 2
-            self._update_font()
+            self._font_timer.start()
             Out.status(self.i18n.t("status.font_size_changed", size=self.font_size))
         else:
             Out.status(self.i18n.t("status.font_size_min"))
 
+    def _font_for(self, size: int) -> QFont:
+        """获取指定字号的字幕字体（按字号缓存）"""
+        font = self._font_cache.get(size)
+        if font is None:
+            font = QFont("Microsoft YaHei", size, QFont.Bold)
+            self._font_cache[size] = font
+        return font
+
     def _update_font(self):
         """更新字幕文本框的字体"""
-        font = QFont("Microsoft YaHei", self.font_size, QFont.Bold)
-        self.subtitle_text.setFont(font)
+        self.subtitle_text.setFont(self._font_for(self.font_size))
 
     def clear_subtitle(self):
         """清空字幕"""
         self.subtitle_history.clear()
+        if self._spill_file is not None:
+            self._spill_file.close()
+            self._spill_file = None
         self.current_partial_text = ""
         self.current_predicted_text = ""
         self.current_source_text = ""
+        self._partial_ts_str = ""
+        self._partial_timer.stop()
+        # 清空时不需要逐个发出 textChanged 等信号
+        self.subtitle_text.blockSignals(True)
         self.subtitle_text.clear()
+        self.subtitle_text.blockSignals(False)
+        self._tail_length = 0
         self.meeting_start_time = datetime.now()  # 重置开始时间
         Out.status(self.i18n.t("status.subtitle_cleared"))
 
@@ -345,25 +429,23 @@ class SubtitleWindow(QWidget):
 
         # 写入文件
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(f"{self.i18n.t('ui.subtitle.meeting_record')}\n")
-                f.write(f"{self.i18n.t('ui.subtitle.start_time')} {self.meeting_start_time.strftime('%Y-%m-%d %H:%M:%S')}\n")
-                f.write(f"{self.i18n.t('ui.subtitle.end_time')} {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-                f.write(f"{self.i18n.t('ui.subtitle.duration')} {duration_minutes} {self.i18n.t('ui.subtitle.minutes')}\n")
-                f.write("=" * 50 + "\n\n")
-
-                # 从结构化数据生成文件格式
-                for item in self.subtitle_history:
-                    timestamp_str = item['timestamp'].strftime("%H:%M:%S")
-                    source = item['source']
-                    target = item['target']
-
-                    if source:
-                        # 双语格式
-                        f.write(f"[{timestamp_str}] {source} 　　　　→ {target}\n\n")
-                    else:
-                        # 单语言格式
-                        f.write(f"[{timestamp_str}] {target}\n\n")
+            with open(filepath, 'w', encoding='utf-8', buffering=1 << 20) as f:
+                f.write(
+                    f"{self.i18n.t('ui.subtitle.meeting_record')}\n"
+                    f"{self.i18n.t('ui.subtitle.start_time')} {self.meeting_start_time.strftime('%Y-%m-%d %H:%M:%S')}\n"
+                    f"{self.i18n.t('ui.subtitle.end_time')} {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
+                    f"{self.i18n.t('ui.subtitle.duration')} {duration_minutes} {self.i18n.t('ui.subtitle.minutes')}\n"
+                    + "=" * 50 + "\n\n"
+                )
+
+                # 先写出已转存到临时文件的旧字幕
+                if self._spill_file is not None:
+                    self._spill_file.seek(0)
+                    shutil.copyfileobj(self._spill_file, f)
+                    self._spill_file.seek(0, os.SEEK_END)
+
+                # 从结构化数据生成文件格式（拼接后一次写入）
+                f.write("".join(map(self._format_record_line, self.subtitle_history)))
 
             return filepath
         except Exception as e:
@@ -411,6 +493,8 @@ if __name__ == "__main__":
 
     from PyQt5.QtWidgets import QApplication
     import time
+    from output_handlers import SubtitleHandler
+    from output_manager import TranslationMessage, MessageType
 
     app = QApplication(sys.argv)
 
@@ -418,6 +502,10 @@ if __name__ == "__main__":
     subtitle_window = SubtitleWindow()
     subtitle_window.show()
 
+    # 与正式运行一致：工作线程通过 SubtitleHandler 的信号把更新转到主线程
+    # （直接在工作线程里调用 update_subtitle 会跨线程操作 QTextDocument 和 QTimer）
+    subtitle_handler = SubtitleHandler(subtitle_window)
+
     # 模拟更新字幕
     def test_update():
         import random
@@ -435,11 +523,11 @@ if __name__ == "__main__":
         ]
 
         for i in range(len(english_samples)):
-            subtitle_window.update_subtitle(
-                english_samples[i],
-                chinese_samples[i]
-            )
-            QApplication.processEvents()
+            subtitle_handler.emit(TranslationMessage(
+                message_type=MessageType.SUBTITLE,
+                source_text=english_samples[i],
+                target_text=chinese_samples[i]
+            ))
             time.sleep(3)
 
     # 在单独线程中测试
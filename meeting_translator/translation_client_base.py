@@ -6,7 +6,6 @@ Provides provider-agnostic interface for real-time translation
 from abc import ABC, abstractmethod
 from typing import Callable, Optional, Dict, Any
 from enum import Enum
-import queue
 
 # Import mixin for composition
 from client_output_mixin import OutputMixin
@@ -27,6 +26,11 @@ class TranslationMode(Enum):
     S2T = "speech_to_text"    # Speech-to-Text: 语音输入 → 翻译 → 文本输出
 
 
+def _noop_queue_audio(audio_data: bytes):
+    """S2T 模式下的音频入队：直接丢弃"""
+    pass
+
+
 class BaseTranslationClient(OutputMixin, ABC):
     """
     Abstract base class for translation clients
@@ -46,7 +50,7 @@ class BaseTranslationClient(OutputMixin, ABC):
         target_language: str = "en",
         voice: Optional[str] = None,
         audio_enabled: bool = True,
-        audio_queue: Optional[queue.Queue] = None,
+        audio_queue: Optional[Any] = None,
         glossary: Optional[Dict[str, str]] = None,
         **kwargs
     ):
@@ -59,7 +63,10 @@ class BaseTranslationClient(OutputMixin, ABC):
             target_language: Target language code (e.g., "en", "zh")
             voice: Voice selection for S2S mode (provider-specific)
             audio_enabled: Whether audio output is enabled (True=S2S, False=S2T)
-            audio_queue: External queue for decoded audio data (used by S2S mode)
+            audio_queue: External queue for decoded audio data (used by S2S mode).
+                Its put_nowait() is called directly from the receive handler and
+                must not raise (e.g. an unbounded queue.Queue or the service's
+                handoff queue); a bounded queue.Queue would leak queue.Full.
             glossary: Glossary dictionary for translation (optional)
             **kwargs: Additional provider-specific parameters
         """
@@ -69,7 +76,15 @@ class BaseTranslationClient(OutputMixin, ABC):
         # 音频相关配置
         self.audio_enabled = audio_enabled
         self.voice = voice if audio_enabled else None
-        self.audio_queue = audio_queue  # 外部队列，用于向 AudioOutputThread 传递音频
+        self.audio_queue = audio_queue  # 外部队列，用于向服务的音频转发线程传递音频
+        # _queue_audio：将解码后的音频数据放入外部队列，构造时一次性绑定，热路径上不再逐块判断
+        # 事件循环只做非阻塞写入，不从队列取数据（消费者只有服务的转发线程）；
+        # 要求外部队列的 put_nowait 不抛异常（无界队列），否则异常会从接收处理中抛出
+        # S2T 模式（或没有外部队列）绑定为空操作
+        if audio_enabled and audio_queue is not None:
+            self._queue_audio = audio_queue.put_nowait
+        else:
+            self._queue_audio = _noop_queue_audio
 
         # 设置基础属性
         self.api_key = api_key
@@ -82,16 +97,6 @@ class BaseTranslationClient(OutputMixin, ABC):
         if self.glossary:
             self.output_debug(f"已加载词汇表，包含 {len(self.glossary)} 个术语")
 
-    def _queue_audio(self, audio_data: bytes):
-        """
-        将解码后的音频数据放入外部队列
-
-        Args:
-            audio_data: 解码后的 PCM 音频数据
-        """
-        if self.audio_enabled and self.audio_queue:
-            self.audio_queue.put(audio_data)
-
     @abstractmethod
     async def connect(self):
         """
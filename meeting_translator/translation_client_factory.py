@@ -3,13 +3,145 @@ Translation Client Factory
 Provides provider-agnostic client instantiation
 """
 
+from functools import lru_cache
 from typing import Optional, Dict
+import importlib
 import os
 
 from translation_client_base import BaseTranslationClient, TranslationProvider
-from qwen_client import QwenClient
-from openai_client import OpenAIClient
-from doubao_client import DoubaoClient
+
+# Provider client modules are imported on first use (each pulls in its own
+# websocket/SDK stack), so only the selected provider pays the import cost.
+
+
+# Environment variables checked (in order) for each provider's API key
+_API_KEY_ENV_MAP = {
+    "aliyun": ("DASHSCOPE_API_KEY", "ALIYUN_API_KEY"),
+    "alibaba": ("DASHSCOPE_API_KEY", "ALIYUN_API_KEY"),
+    "openai": ("OPENAI_API_KEY",),
+    "doubao": ("doubao_app_id", "DOUBAO_APP_ID"),
+    "gemini": ("GEMINI_API_KEY", "GOOGLE_API_KEY"),
+    "deepgram": ("DEEPGRAM_API_KEY",),
+    "elevenlabs": ("ELEVENLABS_API_KEY",),
+    "cartesia": ("CARTESIA_API_KEY",)
+}
+
+@lru_cache(maxsize=None)
+def _resolve_api_key(provider: str) -> str:
+    """
+    Resolve API key from environment (cached per provider)
+
+    The environment is loaded once at startup (load_dotenv), so the first
+    successful lookup is reused. A missing key raises and is not cached.
+    """
+    keys = _API_KEY_ENV_MAP.get(provider, ())
+    for key in keys:
+        value = os.getenv(key)
+        if value:
+            return value
+
+    raise ValueError(
+        f"No API key found for provider '{provider}'. "
+        f"Please set one of: {', '.join(keys)}"
+    )
+
+
+# Default voice per provider (only used in S2S mode)
+_DEFAULT_VOICE_MAP = {
+    "aliyun": "cherry",  # Qwen uses lowercase
+    "alibaba": "cherry",
+    "openai": "marin",  # OpenAI recommends marin or cedar
+    "doubao": "",  # Doubao doesn't support voice selection (voice cloning)
+    "gemini": "en-US-Neural2-F",
+    "elevenlabs": "EXAVITQu4vr4xnSDxMaL"  # Sarah
+}
+
+# Required input sample rate: OpenAI uses 24kHz, others use 16kHz
+_INPUT_SAMPLE_RATES = {
+    "aliyun": 16000,
+    "alibaba": 16000,
+    "openai": 24000,
+    "doubao": 16000,
+}
+
+
+def _build_qwen(client_class, api_key, source_language, target_language, voice,
+                audio_enabled, audio_queue, glossary, **kwargs) -> BaseTranslationClient:
+    """QwenClient: single class supports both S2S and S2T via audio_enabled flag"""
+    return client_class(
+        api_key=api_key,
+        source_language=source_language,
+        target_language=target_language,
+        voice=voice,
+        audio_enabled=audio_enabled,
+        audio_queue=audio_queue,  # 传入外部队列
+        glossary=glossary  # 传入词汇表
+    )
+
+
+def _build_openai(client_class, api_key, source_language, target_language, voice,
+                  audio_enabled, audio_queue, glossary, **kwargs) -> BaseTranslationClient:
+    """OpenAIClient: S2S uses conversation API, S2T uses streaming transcription API"""
+    # Read optional model configurations from environment
+    openai_kwargs = dict(kwargs)
+
+    # S2T model configurations
+    transcribe_model = os.getenv("OPENAI_TRANSCRIBE_MODEL")
+    if transcribe_model:
+        openai_kwargs["transcribe_model"] = transcribe_model
+
+    translation_model = os.getenv("OPENAI_TRANSLATION_MODEL")
+    if translation_model:
+        openai_kwargs["translation_model"] = translation_model
+
+    return client_class(
+        api_key=api_key,
+        source_language=source_language,
+        target_language=target_language,
+        voice=voice,
+        audio_enabled=audio_enabled,
+        audio_queue=audio_queue,
+        glossary=glossary,
+        **openai_kwargs
+    )
+
+
+def _build_doubao(client_class, api_key, source_language, target_language, voice,
+                  audio_enabled, audio_queue, glossary, **kwargs) -> BaseTranslationClient:
+    """DoubaoClient: no voice parameter (uses voice cloning)"""
+    # Doubao requires both app_id and access_token
+    access_token = os.getenv("doubao_access_token")
+    if not access_token:
+        raise ValueError("DOUBAO_ACCESS_TOKEN not found in environment")
+
+    return client_class(
+        api_key=api_key,  # doubao_app_id
+        source_language=source_language,
+        target_language=target_language,
+        audio_enabled=audio_enabled,
+        audio_queue=audio_queue,  # 传入外部队列
+        glossary=glossary,  # 传入词汇表
+        access_token=access_token  # doubao_access_token
+    )
+
+
+# Provider name -> (client module, client class, builder)
+# ("alibaba" kept for backward compatibility)
+_PROVIDERS = {
+    "aliyun": ("qwen_client", "QwenClient", _build_qwen),
+    "alibaba": ("qwen_client", "QwenClient", _build_qwen),
+    "openai": ("openai_client", "OpenAIClient", _build_openai),
+    "doubao": ("doubao_client", "DoubaoClient", _build_doubao),
+}
+
+
+def _client_class(provider: str) -> Optional[type]:
+    """Return the client class for a provider (imported on first use), or None"""
+    entry = _PROVIDERS.get(provider)
+    if entry is None:
+        return None
+    module_name, class_name, _ = entry
+    return getattr(importlib.import_module(module_name), class_name)
 
 
 class TranslationClientFactory:
@@ -37,7 +169,8 @@ class TranslationClientFactory:
             target_language: Target language code
             voice: Voice selection (provider-specific, only for S2S mode)
             audio_enabled: Whether to enable audio output (S2S vs S2T)
-            audio_queue: External audio queue (AudioOutputThread.audio_queue)
+            audio_queue: External queue for decoded S2S audio; its put_nowait()
+                must not raise (see BaseTranslationClient)
             glossary: Glossary dictionary (loaded by main program)
             **kwargs: Additional provider-specific parameters
 
@@ -63,104 +196,34 @@ class TranslationClientFactory:
             voice = TranslationClientFactory._get_default_voice_for_provider(provider)
 
         # Create client based on provider (unified architecture: one class supports both S2S and S2T)
-        if provider == "aliyun" or provider == "alibaba":
-            # Support both "aliyun" and "alibaba" for backward compatibility
-            # QwenClient: single class supports both S2S and S2T via audio_enabled flag
-            return QwenClient(
-                api_key=api_key,
-                source_language=source_language,
-                target_language=target_language,
-                voice=voice,
-                audio_enabled=audio_enabled,
-                audio_queue=audio_queue,  # 传入外部队列
-                glossary=glossary  # 传入词汇表
-            )
-
-        elif provider == "openai":
-            # OpenAIClient: S2S uses conversation API, S2T uses streaming transcription API
-            # Read optional model configurations from environment
-            openai_kwargs = dict(kwargs)
-
-            # S2T model configurations
-            transcribe_model = os.getenv("OPENAI_TRANSCRIBE_MODEL")
-            if transcribe_model:
-                openai_kwargs["transcribe_model"] = transcribe_model
-
-            translation_model = os.getenv("OPENAI_TRANSLATION_MODEL")
-            if translation_model:
-                openai_kwargs["translation_model"] = translation_model
-
-            return OpenAIClient(
-                api_key=api_key,
-                source_language=source_language,
-                target_language=target_language,
-                voice=voice,
-                audio_enabled=audio_enabled,
-                audio_queue=audio_queue,
-                glossary=glossary,
-                **openai_kwargs
-            )
-
-        elif provider == "doubao":
-            # Doubao requires both app_id and access_token
-            access_token = os.getenv("doubao_access_token")
-            if not access_token:
-                raise ValueError("DOUBAO_ACCESS_TOKEN not found in environment")
-
-            # DoubaoClient: no voice parameter (uses voice cloning)
-            return DoubaoClient(
-                api_key=api_key,  # doubao_app_id
-                source_language=source_language,
-                target_language=target_language,
-                audio_enabled=audio_enabled,
-                audio_queue=audio_queue,  # 传入外部队列
-                glossary=glossary,  # 传入词汇表
-                access_token=access_token  # doubao_access_token
-            )
-
-        else:
+        entry = _PROVIDERS.get(provider)
+        if entry is None:
             raise ValueError(
                 f"Unsupported provider: {provider}. "
                 f"Supported providers: aliyun, openai, doubao"
             )
+        builder = entry[2]
+        return builder(
+            _client_class(provider),
+            api_key=api_key,
+            source_language=source_language,
+            target_language=target_language,
+            voice=voice,
+            audio_enabled=audio_enabled,
+            audio_queue=audio_queue,
+            glossary=glossary,
+            **kwargs
+        )
 
     @staticmethod
     def _get_api_key_for_provider(provider: str) -> str:
         """Get API key from environment for given provider"""
-        key_map = {
-            "aliyun": ["DASHSCOPE_API_KEY", "ALIYUN_API_KEY"],
-            "alibaba": ["DASHSCOPE_API_KEY", "ALIYUN_API_KEY"],
-            "openai": ["OPENAI_API_KEY"],
-            "doubao": ["doubao_app_id", "DOUBAO_APP_ID"],
-            "gemini": ["GEMINI_API_KEY", "GOOGLE_API_KEY"],
-            "deepgram": ["DEEPGRAM_API_KEY"],
-            "elevenlabs": ["ELEVENLABS_API_KEY"],
-            "cartesia": ["CARTESIA_API_KEY"]
-        }
-
-        keys = key_map.get(provider, [])
-        for key in keys:
-            value = os.getenv(key)
-            if value:
-                return value
-
-        raise ValueError(
-            f"No API key found for provider '{provider}'. "
-            f"Please set one of: {', '.join(keys)}"
-        )
+        return _resolve_api_key(provider)
 
     @staticmethod
     def _get_default_voice_for_provider(provider: str) -> str:
         """Get default voice for given provider"""
-        defaults = {
-            "aliyun": "cherry",  # Qwen uses lowercase
-            "alibaba": "cherry",
-            "openai": "marin",  # OpenAI recommends marin or cedar
-            "doubao": "",  # Doubao doesn't support voice selection (voice cloning)
-            "gemini": "en-US-Neural2-F",
-            "elevenlabs": "EXAVITQu4vr4xnSDxMaL"  # Sarah
-        }
-        return defaults.get(provider, "")
+        return _DEFAULT_VOICE_MAP.get(provider, "")
 
     @staticmethod
     def get_supported_voices(provider: str) -> Dict[str, str]:
@@ -173,16 +236,8 @@ class TranslationClientFactory:
         Returns:
             Dict mapping voice IDs to display names
         """
-        provider = provider.lower()
-
-        if provider == "aliyun" or provider == "alibaba":
-            return QwenClient.get_supported_voices()
-        elif provider == "openai":
-            return OpenAIClient.get_supported_voices()
-        elif provider == "doubao":
-            return DoubaoClient.get_supported_voices()
-        else:
-            return {}
+        client_class = _client_class(provider.lower())
+        return client_class.get_supported_voices() if client_class else {}
 
     @staticmethod
     def get_supported_voices_i18n(provider: str, i18n) -> Dict[str, str]:
@@ -197,15 +252,12 @@ class TranslationClientFactory:
             Dict mapping voice IDs to translated display names
         """
         provider = provider.lower()
-
-        if provider == "aliyun" or provider == "alibaba":
-            return QwenClient.get_supported_voices_i18n(i18n)
-        elif provider == "openai":
-            return OpenAIClient.get_supported_voices_i18n(i18n)
-        elif provider == "doubao":
-            return DoubaoClient.get_supported_voices()  # Doubao doesn't have voice metadata
-        else:
+        client_class = _client_class(provider)
+        if client_class is None:
             return {}
+        if provider == "doubao":
+            return client_class.get_supported_voices()  # Doubao doesn't have voice metadata
+        return client_class.get_supported_voices_i18n(i18n)
 
     @staticmethod
     def get_supported_languages(provider: str) -> Dict[str, str]:
@@ -218,16 +270,8 @@ class TranslationClientFactory:
         Returns:
             Dict mapping display names to language codes
         """
-        provider = provider.lower()
-
-        if provider == "aliyun" or provider == "alibaba":
-            return QwenClient.get_supported_languages()
-        elif provider == "openai":
-            return OpenAIClient.get_supported_languages()
-        elif provider == "doubao":
-            return DoubaoClient.get_supported_languages()
-        else:
-            return {}
+        client_class = _client_class(provider.lower())
+        return client_class.get_supported_languages() if client_class else {}
 
     @staticmethod
     def get_supported_providers() -> Dict[str, str]:
@@ -299,12 +343,4 @@ class TranslationClientFactory:
             int: Required sample rate in Hz
         """
         provider = provider.lower() if provider else "aliyun"
-
-        # OpenAI uses 24kHz, others use 16kHz
-        sample_rates = {
-            "aliyun": 16000,
-            "alibaba": 16000,
-            "openai": 24000,
-            "doubao": 16000,
-        }
-        return sample_rates.get(provider, 16000)
+        return _INPUT_SAMPLE_RATES.get(provider, 16000)
@@ -4,17 +4,87 @@
 """
 
 import asyncio
+import queue
+import random
 import sys
 import os
+import threading
+from collections import deque
 from typing import Optional, Callable
 
-# 添加 poc 目录到路径
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'poc'))
+try:
+    # 可选：服务工作线程使用 libuv 事件循环（Windows 不支持，回退到 asyncio 默认循环）
+    import uvloop
+except ImportError:
+    uvloop = None
+
+# 添加 poc 目录到路径（重复导入时不再追加）
+_POC_DIR = os.path.join(os.path.dirname(__file__), '..', 'poc')
+if _POC_DIR not in sys.path:
+    sys.path.append(_POC_DIR)
 
 from translation_client_factory import TranslationClientFactory
 
 from output_manager import Out
 
+_create_client = TranslationClientFactory.create_client
+
+# 重连退避参数（秒）：5 次等待上限依次为 2/4/8/16/30 秒（最坏共 60 秒，平均约 30 秒）
+_MAX_RECONNECT_ATTEMPTS = 5
+_RECONNECT_BASE_DELAY = 2.0
+_RECONNECT_MAX_DELAY = 30.0
+_HEALTHY_SESSION_SECONDS = 30.0
+
+
+def _reconnect_delay(attempt: int) -> float:
+    """第 attempt 次重连前的等待时间（full jitter 指数退避）"""
+    return random.uniform(0, min(_RECONNECT_MAX_DELAY, _RECONNECT_BASE_DELAY * 2 ** (attempt - 1)))
+
+
+class _AudioHandoffQueue:
+    """
+    音频交接队列（事件循环 → 转发线程）
+
+    单生产者/单消费者场景下用 deque + Event 代替 queue.Queue：
+    deque 的 append/popleft 本身是原子的，不需要 Queue 每次 put/get 的锁和条件变量，
+    Event 只在队列由空变为非空时唤醒消费者。
+    接口与 queue.Queue 中客户端和转发线程用到的部分兼容（put_nowait/get/get_nowait/task_done）。
+    """
+
+    def __init__(self):
+        self._items = deque()
+        self._ready = threading.Event()
+
+    def put_nowait(self, item):
+        self._items.append(item)
+        self._ready.set()
+
+    put = put_nowait
+
+    def get_nowait(self):
+        try:
+            return self._items.popleft()
+        except IndexError:
+            raise queue.Empty from None
+
+    def get(self, block: bool = True, timeout: Optional[float] = None):
+        items = self._items
+        if not items and block:
+            # 先清除再复查，避免清除前刚放入的数据丢失唤醒
+            self._ready.clear()
+            if not items and not self._ready.wait(timeout):
+                raise queue.Empty
+        return self.get_nowait()
+
+    def task_done(self):
+        """兼容 queue.Queue 接口（没有 join 的使用者，无需计数）"""
+
+    def empty(self) -> bool:
+        return not self._items
+
+    def qsize(self) -> int:
+        return len(self._items)
+
 
 class MeetingTranslationService:
     """会议翻译服务（英文 → 中文）"""
@@ -49,11 +119,31 @@ class MeetingTranslationService:
         self.on_audio_chunk = on_audio_chunk
         self.provider = provider
 
+        # 音频队列（用于 S2S 模式）：整个服务生命周期只创建一次，重连时复用，
+        # 转发线程始终读取同一个队列，不会因客户端替换而失效
+        self._audio_queue = _AudioHandoffQueue() if audio_enabled else None
+
+        # 创建客户端的固定参数（start 和每次重连共用）
+        self._client_kwargs = dict(
+            provider=provider,
+            api_key=api_key,
+            source_language=source_language,
+            target_language=target_language,
+            voice=voice,
+            audio_enabled=audio_enabled,
+            audio_queue=self._audio_queue,  # 传递内部队列
+            glossary=None  # 不使用词汇表
+        )
+
         self.client = None
         self.is_running = False
         self.message_task = None
         self._audio_forward_thread = None
 
+        # 发送队列：采集线程投递的音频由单个发送任务顺序发出（在 start() 中创建，绑定当前事件循环）
+        self._send_queue = None
+        self._send_task = None
+
     async def start(self):
         """启动翻译服务"""
         if self.is_running:
@@ -66,22 +156,9 @@ class MeetingTranslationService:
             # ！重要：先设置 is_running，避免竞态条件
             self.is_running = True
 
-            # 创建音频队列（用于 S2S 模式）
-            import queue
-            audio_queue = queue.Queue() if self.audio_enabled else None
-
             # 使用工厂模式创建客户端（支持多个提供商）
             Out.status(f"创建翻译客户端（provider={self.provider or 'auto'}, audio_enabled={self.audio_enabled}）")
-            self.client = TranslationClientFactory.create_client(
-                provider=self.provider,
-                api_key=self.api_key,
-                source_language=self.source_language,
-                target_language=self.target_language,
-                voice=self.voice,
-                audio_enabled=self.audio_enabled,
-                audio_queue=audio_queue,  # 传递内部队列
-                glossary=None  # 不使用词汇表
-            )
+            self.client = _create_client(**self._client_kwargs)
 
             # 连接到服务
             await self.client.connect()
@@ -95,6 +172,10 @@ class MeetingTranslationService:
                 self._run_with_auto_reconnect()
             )
 
+            # 启动音频发送任务
+            self._send_queue = asyncio.Queue(maxsize=64)
+            self._send_task = asyncio.create_task(self._send_loop())
+
             Out.status("翻译服务已启动")
 
         except Exception as e:
@@ -110,6 +191,10 @@ class MeetingTranslationService:
 
         self.is_running = False
 
+        # 取消音频发送任务
+        if self._send_task:
+            self._send_task.cancel()
+
         # 取消消息处理任务
         if self.message_task:
             self.message_task.cancel()
@@ -132,82 +217,115 @@ class MeetingTranslationService:
 
         Out.status("翻译服务已停止")
 
-    async def send_audio_chunk(self, audio_data: bytes):
+    def enqueue_audio_chunk(self, audio_data: bytes):
         """
-        发送音频数据块
+        把音频数据块放入发送队列（必须在事件循环线程中调用）
 
         Args:
             audio_data: PCM 音频数据（16000 Hz, 单声道, 16-bit）
         """
-        if not self.is_running or not self.client:
+        if not self.is_running or self._send_queue is None:
             return
 
-        await self.client.send_audio_chunk(audio_data)
+        try:
+            self._send_queue.put_nowait(audio_data)
+        except asyncio.QueueFull:
+            # 发送跟不上（网络拥塞）：丢弃最旧的一块，保证实时性
+            self._send_queue.get_nowait()
+            self._send_queue.put_nowait(audio_data)
+
+    async def _send_loop(self):
+        """音频发送循环：取出队列中已就绪的数据，合并后一次发送"""
+        send_queue = self._send_queue
+        while self.is_running:
+            batch = [await send_queue.get()]
+            while len(batch) < 8:
+                try:
+                    batch.append(send_queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+
+            if not self.client:
+                continue
+
+            try:
+                await self.client.send_audio_chunk(batch[0] if len(batch) == 1 else b"".join(batch))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                Out.debug(f"发送音频失败: {e}")
 
     async def _run_with_auto_reconnect(self):
         """
         运行消息处理循环，带自动重连功能
         当检测到连接断开时，会自动尝试重连
         """
-        reconnect_delay = 2  # 重连延迟（秒）
-        max_reconnect_attempts = 3  # 最大重连次数
+        max_reconnect_attempts = _MAX_RECONNECT_ATTEMPTS  # 最大重连次数
         reconnect_count = 0
+        loop = asyncio.get_running_loop()
 
         while self.is_running:
             try:
                 # 运行消息处理
+                session_start = loop.time()
                 await self.client.handle_server_messages()
 
+                # 连接稳定运行过一段时间，清零计数
+                if loop.time() - session_start >= _HEALTHY_SESSION_SECONDS:
+                    reconnect_count = 0
+
                 # 如果正常退出循环，检查是否需要重连
                 if self.is_running and not self.client.is_connected:
                     Out.warning("连接已断开，准备重连...")
-                    reconnect_count += 1
 
-                    if reconnect_count > max_reconnect_attempts:
-                        Out.error(f"重连失败次数过多 ({max_reconnect_attempts})，停止服务")
-                        Out.user_alert(f"连接断开，已尝试重连 {max_reconnect_attempts} 次失败", "连接失败")
+                    # 重连失败（connect 抛出异常）也计入次数，在这里按退避等待后重试
+                    reconnected = False
+                    while self.is_running:
+                        reconnect_count += 1
+
+                        if reconnect_count > max_reconnect_attempts:
+                            Out.error(f"重连失败次数过多 ({max_reconnect_attempts})，停止服务")
+                            Out.user_alert(f"连接断开，已尝试重连 {max_reconnect_attempts} 次失败", "连接失败")
+                            break
+
+                        # 等待后重连（指数退避 + 随机抖动，避免服务恢复时所有客户端同时重连）
+                        reconnect_delay = _reconnect_delay(reconnect_count)
+                        Out.status(f"等待 {reconnect_delay:.1f} 秒后重连（第 {reconnect_count}/{max_reconnect_attempts} 次）...")
+                        await asyncio.sleep(reconnect_delay)
+
+                        # 关闭旧连接
+                        try:
+                            await self.client.close()
+                        except:
+                            pass
+
+                        # 清空音频队列中旧连接残留的数据（队列本身复用）
+                        self._drain_audio_queue()
+
+                        # 重新创建客户端（使用工厂模式）
+                        self.client = _create_client(**self._client_kwargs)
+
+                        # 重新连接
+                        try:
+                            await self.client.connect()
+                        except Exception as e:
+                            Out.warning(f"重连失败: {e}")
+                            continue
+
+                        reconnected = True
                         break
 
-                    # 等待后重连
-                    Out.status(f"等待 {reconnect_delay} 秒后重连（第 {reconnect_count}/{max_reconnect_attempts} 次）...")
-                    await asyncio.sleep(reconnect_delay)
-
-                    # 关闭旧连接
-                    try:
-                        await self.client.close()
-                    except:
-                        pass
-
-                    # 创建新的音频队列（用于 S2S 模式）
-                    import queue
-                    audio_queue = queue.Queue() if self.audio_enabled else None
-
-                    # 重新创建客户端（使用工厂模式）
-                    self.client = TranslationClientFactory.create_client(
-                        provider=self.provider,
-                        api_key=self.api_key,
-                        source_language=self.source_language,
-                        target_language=self.target_language,
-                        voice=self.voice,
-                        audio_enabled=self.audio_enabled,
-                        audio_queue=audio_queue,
-                        glossary=None
-                    )
-
-                    # 重新连接
-                    await self.client.connect()
-                    Out.status("重连成功")
+                    if not reconnected:
+                        break
 
-                    # 重置重连计数
-                    reconnect_count = 0
+                    # 不在此处清零计数：只有连接稳定运行 _HEALTHY_SESSION_SECONDS 后才清零，
+                    # 避免服务端"接受即断开"时每次都从第 1 次的短等待开始
+                    Out.status("重连成功")
 
-                    # 如果启用音频，重启音频转发
+                    # 转发线程读取的是同一个音频队列，重连后继续工作；只在它意外退出时重新启动
                     if self.audio_enabled and self.on_audio_chunk:
-                        # 停止旧的转发线程
-                        if hasattr(self, '_audio_forward_thread') and self._audio_forward_thread:
-                            self._audio_forward_thread.join(timeout=1)
-                        # 启动新的转发线程
-                        self._start_audio_forwarding()
+                        if not (self._audio_forward_thread and self._audio_forward_thread.is_alive()):
+                            self._start_audio_forwarding()
 
                     # 通知用户重连成功
                     Out.status("连接已恢复")
@@ -224,14 +342,26 @@ class MeetingTranslationService:
                 import traceback
                 traceback.print_exc()
 
-                # 等待后重试
+                # 消息处理出错（连接失败已在上面的重连循环中计数和等待），等待后重试
                 if self.is_running:
-                    await asyncio.sleep(reconnect_delay)
+                    await asyncio.sleep(_reconnect_delay(max(reconnect_count, 1)))
+
+    def _drain_audio_queue(self):
+        """丢弃音频队列中尚未转发的数据"""
+        audio_queue = self._audio_queue
+        if audio_queue is None:
+            return
+
+        while True:
+            try:
+                audio_queue.get_nowait()
+            except queue.Empty:
+                break
+            audio_queue.task_done()
 
     def _start_audio_forwarding(self):
         """启动音频转发线程（从 API 队列→外部回调）"""
-        import threading
-        import queue
+        audio_queue = self._audio_queue
 
         def forward_loop():
             """音频转发循环（在独立线程中运行）"""
@@ -239,19 +369,30 @@ class MeetingTranslationService:
 
             while self.is_running:
                 try:
-                    # 从 API 客户端的外部队列获取音频数据
-                    audio_data = self.client.audio_queue.get(timeout=0.1)
-
-                    if audio_data is None:
-                        Out.status("[音频转发] 收到终止信号")
-                        break
+                    # 从 API 客户端的外部队列获取音频数据：阻塞取一块，再把已就绪的一并取出，
+                    # 合并后只回调一次（减少线程唤醒和逐块回调的开销）
+                    batch = [audio_queue.get(timeout=0.1)]
+                    while len(batch) < 16 and batch[-1] is not None:
+                        try:
+                            batch.append(audio_queue.get_nowait())
+                        except queue.Empty:
+                            break
+
+                    stop = batch[-1] is None
+                    if stop:
+                        batch.pop()
 
                     # 转发到外部回调（写入虚拟麦克风）
-                    if self.on_audio_chunk:
-                        self.on_audio_chunk(audio_data)
+                    if batch and self.on_audio_chunk:
+                        self.on_audio_chunk(batch[0] if len(batch) == 1 else b"".join(batch))
+
+                    # 标记任务完成（含终止信号）
+                    for _ in range(len(batch) + stop):
+                        audio_queue.task_done()
 
-                    # 标记任务完成
-                    self.client.audio_queue.task_done()
+                    if stop:
+                        Out.status("[音频转发] 收到终止信号")
+                        break
 
                 except queue.Empty:
                     continue
@@ -301,10 +442,8 @@ class MeetingTranslationServiceWrapper:
         if self.is_running:
             return
 
-        import threading
-
-        # 创建事件循环
-        self.loop = asyncio.new_event_loop()
+        # 创建事件循环（有 uvloop 时优先使用）
+        self.loop = uvloop.new_event_loop() if uvloop else asyncio.new_event_loop()
 
         # 在独立线程中运行事件循环
         def run_loop():
@@ -399,11 +538,12 @@ class MeetingTranslationServiceWrapper:
         if not self.is_running or not self.service or not self.loop:
             return
 
-        # 在事件循环中执行
-        asyncio.run_coroutine_threadsafe(
-            self.service.send_audio_chunk(audio_data),
-            self.loop
-        )
+        # 投递到事件循环线程的发送队列（不为每块音频创建 Task）
+        try:
+            self.loop.call_soon_threadsafe(self.service.enqueue_audio_chunk, audio_data)
+        except RuntimeError:
+            # 事件循环已关闭（正在停止）
+            pass
 
 
 # 测试代码